@@ -30,9 +30,10 @@ try:
     if 'DISPLAY' not in os.environ and 'WAYLAND_DISPLAY' not in os.environ:
         gui_import_error = "No display environment detected"
     else:
-        # Try importing GUI components
-        from easy_exe_gui import create_gui_wrapper, HAS_QT
-        if HAS_QT:
+        # Try importing GUI components (PyQt6 itself is only imported on first use)
+        import importlib.util
+        from easy_exe_gui import create_gui_wrapper
+        if importlib.util.find_spec("PyQt6") is not None:
             GUI_AVAILABLE = True
         else:
             gui_import_error = "PyQt6 not available in easy_exe_gui module"
@@ -45,6 +46,8 @@ class EasyEXE:
     def __init__(self, force_cli: bool = False, verbose: bool = False):
         self.force_cli = force_cli
         self.verbose = verbose
+        # Resolved by the first _get_available_package_managers() call
+        self._package_managers: Optional[Tuple[str, ...]] = None
         self.setup_paths()
         self.setup_logging()
         self.load_dependencies()
@@ -664,7 +667,10 @@ class EasyEXE:
         return False
 
     def _get_available_package_managers(self) -> List[str]:
-        """Get list of available package managers"""
+        """Get list of available package managers (probed once per instance)"""
+        if self._package_managers is not None:
+            return list(self._package_managers)
+
         managers = []
         checks = {
             'arch': 'pacman',
@@ -679,19 +685,22 @@ class EasyEXE:
             if self._check_command(command):
                 managers.append(manager)
 
+        # Installed package managers don't change mid-run; callers get their own copy
+        self._package_managers = tuple(managers)
         return managers
 
+    _INSTALL_COMMANDS = {
+        'arch': 'sudo pacman -S {package}',
+        'ubuntu': 'sudo apt install {package}',
+        'debian': 'sudo apt install {package}',
+        'fedora': 'sudo dnf install {package}',
+        'flatpak': 'flatpak install {package}',
+        'snap': 'sudo snap install {package}'
+    }
+
     def _get_install_command(self, manager: str, package: str) -> str:
         """Get installation command for package manager"""
-        commands = {
-            'arch': f'sudo pacman -S {package}',
-            'ubuntu': f'sudo apt install {package}',
-            'debian': f'sudo apt install {package}',
-            'fedora': f'sudo dnf install {package}',
-            'flatpak': f'flatpak install {package}',
-            'snap': f'sudo snap install {package}'
-        }
-        return commands.get(manager, f'# Install {package}')
+        return self._INSTALL_COMMANDS.get(manager, '# Install {package}').format(package=package)
 
     def _offer_web_search(self, search_term: str):
         """Open browser to alternativeto.net"""
@@ -1307,8 +1316,10 @@ def main():
         if GUI_AVAILABLE:
             print("Testing GUI components...")
             try:
-                from easy_exe_gui import QApplication, DependencyDialog
-                app = QApplication(sys.argv)
+                import easy_exe_gui
+                if not easy_exe_gui._ensure_qt():
+                    raise ImportError("PyQt6 could not be imported")
+                app = easy_exe_gui.EasyEXEGUI._get_application()
 
                 mock_deps = [
                     ("wine", {
@@ -1323,7 +1334,7 @@ def main():
                     })
                 ]
 
-                dialog = DependencyDialog(mock_deps, "ubuntu", False, None)
+                dialog = easy_exe_gui.DependencyDialog(mock_deps, "ubuntu", False, None)
                 dialog.show()
 
                 print("GUI test dialog opened. Close it to continue...")
@@ -5,65 +5,149 @@ Provides modern GUI dialogs while maintaining CLI compatibility
 """
 
 import sys
+import functools
+import html
 import os
+import shlex
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Tuple, Any
-import subprocess
-import webbrowser
 
-try:
-    from PyQt6.QtWidgets import (
-        QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-        QPushButton, QTextEdit, QCheckBox, QButtonGroup, QRadioButton,
-        QScrollArea, QWidget, QMessageBox, QProgressDialog, QFrame,
-        QGridLayout, QSpacerItem, QSizePolicy
-    )
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-    from PyQt6.QtGui import QFont, QIcon, QPixmap, QPalette
-    HAS_QT = True
-except ImportError:
-    HAS_QT = False
-    # Create dummy classes when PyQt6 is not available
-    class QThread:
-        pass
-    class QDialog:
-        pass
-    class pyqtSignal:
-        def __init__(self, *args):
-            pass
-    class Qt:
-        class WindowModality:
-            WindowModal = None
+# PyQt6 is imported on first use so CLI-only runs never pay for it.
+# HAS_QT stays None until _ensure_qt() has tried the import.
+HAS_QT = None
+_qt = None
 
-if HAS_QT:
-    class DependencyInstallThread(QThread):
-        """Background thread for installing dependencies"""
-        progress_update = pyqtSignal(str)
-        installation_complete = pyqtSignal(bool, str)
-        
-        def __init__(self, command: str, package_name: str):
-            super().__init__()
-            self.command = command
-            self.package_name = package_name
-        
-        def run(self):
-            try:
-                self.progress_update.emit(f"Installing {self.package_name}...")
-                result = subprocess.run(
-                    self.command.split(), 
-                    capture_output=True, 
-                    text=True,
-                    check=True
-                )
-                self.installation_complete.emit(True, f"{self.package_name} installed successfully!")
-            except subprocess.CalledProcessError as e:
-                self.installation_complete.emit(False, f"Installation failed: {e}")
-            except Exception as e:
-                self.installation_complete.emit(False, f"Error: {e}")
-else:
-    class DependencyInstallThread:
-        def __init__(self, *args, **kwargs):
-            pass
+# Shared by every EasyEXEGUI instance so the application is configured once
+_APP_SINGLETON = None
+
+# qasync event loop driving the QApplication; False once qasync is known to be missing
+_ASYNC_LOOP = None
+
+# Application-wide stylesheet, parsed once when the QApplication is created.
+# Dialog widgets pick up their rules through setObjectName().
+_APP_QSS = """
+    QLabel#errorHeader { font-size: 18px; font-weight: bold; color: #d32f2f; margin: 10px; }
+    QLabel#infoHeader { font-size: 18px; font-weight: bold; color: #1976d2; margin: 10px; }
+    QLabel#subtitle { margin: 5px 10px; font-size: 14px; }
+    QFrame#terminalFrame { background-color: #f5f5f5; border: 1px solid #ddd; border-radius: 4px; }
+    QLabel#terminalTitle { font-weight: bold; margin: 5px; }
+    QTextEdit#terminal { background-color: #2b2b2b; color: #ffffff; font-family: monospace; }
+    QLabel#depList { padding: 10px; }
+    QListView#depView { border: 1px solid #ddd; }
+    QLabel#programHeader { font-size: 16px; font-weight: bold; margin: 8px; }
+    QLabel#programInfo { background-color: #f8f8f8; border: 1px solid #ddd; border-radius: 4px; padding: 8px; }
+    QLabel#explanation { margin: 5px; color: #555; font-size: 12px; }
+    QLabel#alternativeHeader { font-size: 16px; font-weight: bold; color: #1976d2; margin: 8px; }
+    QLabel#comparison { border: 1px solid #ddd; border-radius: 4px; padding: 12px; }
+    QPushButton#installButton { background-color: #4caf50; color: white; font-weight: bold; padding: 8px; }
+    QLabel#warningIcon { font-size: 24px; }
+    QLabel#warningTitle { font-size: 14px; font-weight: bold; color: #f57c00; }
+    QLabel#warningMessage { margin: 5px; font-size: 12px; }
+    QFrame#instructionsFrame { background-color: #f8f8f8; border: 1px solid #ddd; border-radius: 4px; padding: 8px; }
+    QLabel#instructionsTitle { font-weight: bold; font-size: 12px; }
+    QLabel#instruction { margin-left: 5px; font-size: 11px; }
+    QCheckBox#disableCheckbox { font-size: 11px; }
+"""
+
+def _ensure_qt() -> bool:
+    """Import PyQt6 once and define the Qt-backed classes"""
+    global HAS_QT, _qt
+    if HAS_QT is None:
+        try:
+            import PyQt6.QtWidgets as _w
+            import PyQt6.QtCore as _c
+            import PyQt6.QtGui as _g
+        except ImportError:
+            HAS_QT = False
+        else:
+            _qt = SimpleNamespace(**{
+                name: obj
+                for module in (_c, _g, _w)
+                for name, obj in vars(module).items()
+                if not name.startswith('_')
+            })
+            HAS_QT = True
+            _define_dialog_classes()
+    return HAS_QT
+
+def _get_async_loop():
+    """Return a qasync event loop bound to the shared QApplication, or None without qasync"""
+    global _ASYNC_LOOP
+    if _ASYNC_LOOP is None:
+        try:
+            import qasync
+        except ImportError:
+            _ASYNC_LOOP = False
+        else:
+            import asyncio
+            _ASYNC_LOOP = qasync.QEventLoop(EasyEXEGUI._get_application())
+            asyncio.set_event_loop(_ASYNC_LOOP)
+    return _ASYNC_LOOP or None
+
+# Only allow auto-install for safe package managers
+_SAFE_PREFIXES = ('sudo apt install', 'sudo pacman -S', 'flatpak install')
+
+def _resolve_install_command(dep_name: str, dep_info: Dict, distro: str) -> str:
+    """Pick a dependency's install command for the distro, falling back to a placeholder"""
+    commands = dep_info.get("commands", {})
+    return commands.get(distro, commands.get("unknown", f"# Please install {dep_name}"))
+
+@functools.lru_cache(maxsize=64)
+def _build_terminal_instructions(install_cmds: Tuple[str, ...]) -> str:
+    """Render the terminal guide for a set of install commands, shared across dialogs"""
+    lines = [
+        "1. Open terminal: Ctrl+Alt+T (or search 'Terminal')",
+        "2. Copy and run these commands:",
+        "",
+    ]
+    lines.extend(f"   {install_cmd}" for install_cmd in install_cmds)
+    lines.append("")
+    lines.append("3. Run Easy EXE again after installation!")
+    return "\n".join(lines)
+
+# Final (width, height) per dialog class and content fingerprint, so repeat
+# opens skip the adjustSize()/sizeHint() layout pass
+_COMPACT_SIZES: Dict[tuple, Tuple[int, int]] = {}
+
+@functools.lru_cache(maxsize=1)
+def _screen_geometry():
+    """Available geometry of the primary screen, cached until the screen changes"""
+    return _qt.QApplication.primaryScreen().availableGeometry()
+
+def _invalidate_screen_caches(*_):
+    """Forget the screen geometry and every dialog size derived from it"""
+    _screen_geometry.cache_clear()
+    _COMPACT_SIZES.clear()
+
+def _watch_screen(screen):
+    """Invalidate the screen caches now and whenever this screen's geometry or DPI changes"""
+    _invalidate_screen_caches()
+    if screen is not None:
+        screen.availableGeometryChanged.connect(_invalidate_screen_caches)
+        screen.logicalDotsPerInchChanged.connect(_invalidate_screen_caches)
+
+def _apply_compact_size(dialog, fingerprint, width_ratio: float, height_ratio: float,
+                        min_width: int, min_height: int):
+    """Size a dialog to its content within screen-relative bounds and center it"""
+    screen = _screen_geometry()
+    key = (type(dialog).__name__, fingerprint)
+    size = _COMPACT_SIZES.get(key)
+    if size is None:
+        dialog.adjustSize()
+        optimal_size = dialog.sizeHint()
+        size = _COMPACT_SIZES[key] = (
+            min(max(optimal_size.width(), min_width), int(screen.width() * width_ratio)),
+            min(max(optimal_size.height(), min_height), int(screen.height() * height_ratio)),
+        )
+    
+    final_width, final_height = size
+    dialog.resize(final_width, final_height)
+    dialog.move(
+        (screen.width() - final_width) // 2,
+        (screen.height() - final_height) // 2
+    )
 
 class EasyEXEGUI:
     """GUI interface for Easy EXE dialogs and interactions"""
@@ -72,45 +156,110 @@ class EasyEXEGUI:
         self.easy_exe = easy_exe_instance
         self.app = None
         
-        # Initialize Qt application if GUI is available
-        if HAS_QT and not QApplication.instance():
-            self.app = QApplication(sys.argv)
-            self.app.setApplicationName("Easy EXE")
-            self.app.setApplicationDisplayName("Easy EXE - Windows Executable Launcher")
-            
-            # Set application style
-            self.app.setStyle('Fusion')  # Modern, consistent look across platforms
+        # Constructed dialogs, reused when the same content is shown again
+        self._dialog_cache: Dict[tuple, Any] = {}
+        
+        # Resolved by the first is_gui_available() call; Qt is untouched until then.
+        # Neither PyQt6 nor the display can appear mid-run, so it is resolved once.
+        self._gui_available: Optional[bool] = None
     
     def is_gui_available(self) -> bool:
         """Check if GUI is available and display is accessible"""
-        if not HAS_QT:
+        if self._gui_available is None:
+            # Check for a display first so headless runs never import PyQt6
+            has_display = bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+            self._gui_available = has_display and _ensure_qt()
+            if self._gui_available:
+                self.app = self._get_application()
+                # A DISPLAY variable alone does not prove windows can be shown (WSL, CI)
+                self._gui_available = self._probe_display()
+        return self._gui_available
+    
+    @staticmethod
+    def _probe_display() -> bool:
+        """Check that the Qt platform can give a widget a real native window"""
+        if _qt.QGuiApplication.platformName() == "offscreen":
             return False
-        
-        # Check if we have a display (not running headless)
         try:
-            if os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'):
-                return True
-            return False
-        except:
+            probe = _qt.QWidget()
+            probe.winId()
+        except Exception:
             return False
+        return True
+    
+    @staticmethod
+    def _get_application():
+        """Return the shared QApplication, creating and configuring it on first use"""
+        global _APP_SINGLETON
+        if _APP_SINGLETON is None:
+            if not os.environ.get('QT_QPA_PLATFORM'):
+                # Qt aborts the process when the display can't be reached (WSL, CI).
+                # Falling back to offscreen lets _probe_display() report it instead.
+                native = 'wayland;xcb' if os.environ.get('WAYLAND_DISPLAY') else 'xcb'
+                os.environ['QT_QPA_PLATFORM'] = f'{native};offscreen'
+            _APP_SINGLETON = _qt.QApplication.instance() or _qt.QApplication(sys.argv)
+            _APP_SINGLETON.setApplicationName("Easy EXE")
+            _APP_SINGLETON.setApplicationDisplayName("Easy EXE - Windows Executable Launcher")
+            
+            # Set application style
+            _APP_SINGLETON.setStyle('Fusion')  # Modern, consistent look across platforms
+            _APP_SINGLETON.setStyleSheet(_APP_QSS)
+            
+            # Cached dialog geometry is only valid for the screen it was computed on
+            _watch_screen(_APP_SINGLETON.primaryScreen())
+            _APP_SINGLETON.primaryScreenChanged.connect(_watch_screen)
+        return _APP_SINGLETON
+    
+    def _exec_dialog(self, dialog) -> int:
+        """Run the dependency dialog under the qasync loop when available so async installs can progress"""
+        loop = _get_async_loop()
+        if loop is None:
+            return dialog.exec()
+        
+        finished = loop.create_future()
+        
+        def on_finished(result):
+            if not finished.done():
+                finished.set_result(result)
+        
+        # Cached dialogs are shown repeatedly, so the slot must not outlive this show
+        dialog.finished.connect(on_finished)
+        dialog.setWindowModality(_qt.Qt.WindowModality.ApplicationModal)
+        dialog.open()
+        try:
+            return loop.run_until_complete(finished)
+        finally:
+            dialog.finished.disconnect(on_finished)
     
     def show_dependency_dialog(self, missing_deps: List[Tuple[str, Dict]], distro: str, required: bool) -> bool:
         """Show dependency installation dialog"""
         if not self.is_gui_available():
-            return False
-            
-        dialog = DependencyDialog(missing_deps, distro, required, self.easy_exe)
-        return dialog.exec() == QDialog.DialogCode.Accepted
+            # No usable display: print the terminal guide instead of building widgets
+            print(_build_terminal_instructions(tuple(
+                _resolve_install_command(dep_name, dep_info, distro) for dep_name, dep_info in missing_deps
+            )))
+            return not required
+            
+        key = ("dependency", distro, required, tuple(dep_name for dep_name, _ in missing_deps))
+        dialog = self._dialog_cache.get(key)
+        if dialog is None:
+            dialog = self._dialog_cache[key] = DependencyDialog(missing_deps, distro, required, self.easy_exe)
+        return self._exec_dialog(dialog) == _qt.QDialog.DialogCode.Accepted
     
     def show_unknown_program_dialog(self, exe_path: str, pe_info: Dict) -> Tuple[bool, str]:
         """Show unknown program identification dialog"""
         if not self.is_gui_available():
             return False, "fallback"
             
-        dialog = UnknownProgramDialog(exe_path, pe_info)
+        # One instance serves every program; only its text and selection change
+        dialog = self._dialog_cache.get(("unknown",))
+        if dialog is None:
+            dialog = self._dialog_cache[("unknown",)] = UnknownProgramDialog(exe_path, pe_info)
+        else:
+            dialog.reset(exe_path, pe_info)
         result = dialog.exec()
         
-        if result == QDialog.DialogCode.Accepted:
+        if result == _qt.QDialog.DialogCode.Accepted:
             return True, dialog.get_choice()
         return False, "cancel"
     
@@ -119,10 +268,14 @@ class EasyEXEGUI:
         if not self.is_gui_available():
             return False, "continue"
             
-        dialog = AlternativeDialog(program_config, self.easy_exe)
+        dialog = self._dialog_cache.get(("alternative",))
+        if dialog is None:
+            dialog = self._dialog_cache[("alternative",)] = AlternativeDialog(program_config, self.easy_exe)
+        else:
+            dialog.reset(program_config)
         result = dialog.exec()
         
-        if result == QDialog.DialogCode.Accepted:
+        if result == _qt.QDialog.DialogCode.Accepted:
             return True, dialog.get_choice()
         return False, "continue"
     
@@ -131,14 +284,165 @@ class EasyEXEGUI:
         if not self.is_gui_available():
             return True, False
             
-        dialog = WarningDialog(warning_type, program_name, self.easy_exe)
+        # The layout only depends on the warning type; the program name is just text
+        key = ("warning", warning_type)
+        dialog = self._dialog_cache.get(key)
+        if dialog is None:
+            dialog = self._dialog_cache[key] = WarningDialog(warning_type, program_name, self.easy_exe)
+        else:
+            dialog.reset(program_name)
         result = dialog.exec()
         
-        if result == QDialog.DialogCode.Accepted:
+        if result == _qt.QDialog.DialogCode.Accepted:
             return True, dialog.should_disable_warnings()
         return False, dialog.should_disable_warnings()
 
-if HAS_QT:
+def _define_dialog_classes():
+    """Define the dialog classes; only called by _ensure_qt() once PyQt6 is importable"""
+    global InstallWorker, DependencyDialog, UnknownProgramDialog, AlternativeDialog, WarningDialog
+
+    from PyQt6.QtWidgets import (
+        QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+        QPushButton, QTextEdit, QCheckBox, QButtonGroup, QRadioButton,
+        QMessageBox, QProgressDialog, QFrame, QListView, QStyledItemDelegate
+    )
+    from PyQt6.QtCore import (
+        Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer,
+        QAbstractListModel, QModelIndex, QRect, QSize
+    )
+    from PyQt6.QtGui import QFont, QPalette, QColor, QFontMetrics
+    import asyncio
+
+    class WorkerSignals(QObject):
+        """Signals for InstallWorker (QRunnable is not a QObject)"""
+        progress_update = pyqtSignal(str)
+        installation_complete = pyqtSignal(bool, str)
+    
+    class InstallWorker(QRunnable):
+        """Pooled background worker for installing dependencies"""
+        
+        # Minimum seconds between progress updates so chatty installs don't flood the event queue
+        PROGRESS_INTERVAL = 0.05
+        
+        def __init__(self, command: str, package_name: str):
+            super().__init__()
+            self.command = command
+            self.argv = shlex.split(command)
+            self.package_name = package_name
+            self.signals = WorkerSignals()
+        
+        def run(self):
+            import subprocess  # Only needed once an install is actually requested
+            
+            try:
+                self.signals.progress_update.emit(f"Installing {self.package_name}...")
+                # Stream output line by line rather than buffering the whole install log
+                with subprocess.Popen(
+                    self.argv,
+                    shell=False,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    errors="replace",
+                    bufsize=1
+                ) as proc:
+                    last_update = 0.0
+                    for line in proc.stdout:
+                        line = line.rstrip()
+                        now = time.monotonic()
+                        if line and now - last_update >= self.PROGRESS_INTERVAL:
+                            self.signals.progress_update.emit(line)
+                            last_update = now
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, self.argv)
+                self.signals.installation_complete.emit(True, f"{self.package_name} installed successfully!")
+            except subprocess.CalledProcessError as e:
+                self.signals.installation_complete.emit(False, f"Installation failed: {e}")
+            except Exception as e:
+                self.signals.installation_complete.emit(False, f"Error: {e}")
+
+    class DepsModel(QAbstractListModel):
+        """Read-only list of (name, description, install_cmd, benefits) dependency rows"""
+        
+        def __init__(self, rows: List[Tuple[str, str, str, Tuple[str, ...]]], parent=None):
+            super().__init__(parent)
+            self._rows = rows
+        
+        def rowCount(self, parent=QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self._rows)
+        
+        def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+            if not index.isValid():
+                return None
+            row = self._rows[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole:
+                return row[0]
+            if role == Qt.ItemDataRole.UserRole:
+                return row
+            return None
+
+    class DepDelegate(QStyledItemDelegate):
+        """Paints a dependency row the way DependencyDialog.dependency_html lays it out"""
+        
+        PADDING = 8
+        INDENT = 20
+        
+        @staticmethod
+        def _fonts(option) -> Tuple[QFont, QFont, QFont]:
+            name_font = QFont(option.font)
+            name_font.setBold(True)
+            mono_font = QFont("monospace")
+            mono_font.setStyleHint(QFont.StyleHint.Monospace)
+            return name_font, option.font, mono_font
+        
+        def sizeHint(self, option, index) -> QSize:
+            _, _, _, benefits = index.data(Qt.ItemDataRole.UserRole)
+            name_font, body_font, mono_font = self._fonts(option)
+            body_height = QFontMetrics(body_font).height()
+            height = (
+                QFontMetrics(name_font).height()
+                + body_height
+                + QFontMetrics(mono_font).height() + 4
+            )
+            if benefits:
+                height += QFontMetrics(name_font).height() + body_height * len(benefits)
+            return QSize(0, height + 2 * self.PADDING)
+        
+        def paint(self, painter, option, index):
+            dep_name, description, install_cmd, benefits = index.data(Qt.ItemDataRole.UserRole)
+            name_font, body_font, mono_font = self._fonts(option)
+            area = option.rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+            top = area.top()
+            
+            def draw_line(font, text, indent=0, color=None, background=None):
+                nonlocal top
+                metrics = QFontMetrics(font)
+                line = QRect(area.left() + indent, top, area.width() - indent, metrics.height())
+                if background is not None:
+                    line.adjust(0, 0, 0, 4)
+                    painter.fillRect(line, background)
+                painter.setFont(font)
+                painter.setPen(color or option.palette.color(QPalette.ColorRole.Text))
+                painter.drawText(
+                    line.adjusted(2, 0, -2, 0),
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                    metrics.elidedText(text, Qt.TextElideMode.ElideRight, line.width() - 4),
+                )
+                top = line.bottom() + 1
+            
+            painter.save()
+            draw_line(name_font, f"📦 {dep_name}")
+            draw_line(body_font, description, self.INDENT, QColor("#666"))
+            draw_line(mono_font, f"Install: {install_cmd}", background=QColor("#f0f0f0"))
+            if benefits:
+                draw_line(name_font, "Benefits:", self.INDENT)
+                for benefit in benefits:
+                    draw_line(body_font, f"• {benefit}", 2 * self.INDENT, QColor("#555"))
+            
+            painter.setPen(QColor("#ddd"))
+            painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+            painter.restore()
+
     class DependencyDialog(QDialog):
         """Dialog for showing missing dependencies and installation options"""
         
@@ -148,11 +452,23 @@ if HAS_QT:
             self.distro = distro
             self.required = required
             self.easy_exe = easy_exe
-            self.install_thread = None
+            self.install_count = 0
+            self.install_results = []
+            self.install_workers = []
+            self.install_tasks = []
+            self._pool = QThreadPool.globalInstance()
+            
+            # Resolve each install command once for the list, buttons and terminal guide
+            self._resolved: List[Tuple[str, Dict, str]] = [
+                (dep_name, dep_info, _resolve_install_command(dep_name, dep_info, distro))
+                for dep_name, dep_info in missing_deps
+            ]
             
             self.setup_ui()
         
         def setup_ui(self):
+            # Build the whole widget tree before Qt repaints anything
+            self.setUpdatesEnabled(False)
             self.setWindowTitle("Easy EXE - Dependencies")
             self.setMinimumSize(600, 400)
             
@@ -161,45 +477,66 @@ if HAS_QT:
             # Header
             if self.required:
                 header = QLabel("❌ Missing Core Dependencies")
-                header.setStyleSheet("font-size: 18px; font-weight: bold; color: #d32f2f; margin: 10px;")
+                header.setObjectName("errorHeader")
                 subtitle = QLabel("Easy EXE cannot continue without these essential tools.")
             else:
                 header = QLabel("💡 Enhanced Experience Available")
-                header.setStyleSheet("font-size: 18px; font-weight: bold; color: #1976d2; margin: 10px;")
+                header.setObjectName("infoHeader")
                 subtitle = QLabel("Easy EXE is ready! Consider these enhancements for the best experience:")
             
-            subtitle.setStyleSheet("margin: 5px 10px; font-size: 14px;")
+            subtitle.setObjectName("subtitle")
             layout.addWidget(header)
             layout.addWidget(subtitle)
             
-            # Scrollable dependencies list
-            scroll = QScrollArea()
-            scroll_widget = QWidget()
-            scroll_layout = QVBoxLayout()
-            
-            for dep_name, dep_info in self.missing_deps:
-                dep_frame = self.create_dependency_frame(dep_name, dep_info)
-                scroll_layout.addWidget(dep_frame)
-            
-            scroll_widget.setLayout(scroll_layout)
-            scroll.setWidget(scroll_widget)
-            scroll.setWidgetResizable(True)
-            layout.addWidget(scroll)
+            # Short lists render as one rich-text label; long ones go through a
+            # model/delegate view that only paints the rows on screen
+            if len(self.missing_deps) > 3:
+                deps_view = QListView()
+                deps_view.setObjectName("depView")
+                deps_view.setModel(DepsModel(self.dependency_rows(), deps_view))
+                deps_view.setItemDelegate(DepDelegate(deps_view))
+                deps_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+                deps_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+                deps_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+                layout.addWidget(deps_view, 1)
+            else:
+                deps_label = QLabel("<hr>".join(
+                    self.dependency_html(dep_name, dep_info, install_cmd)
+                    for dep_name, dep_info, install_cmd in self._resolved
+                ))
+                deps_label.setObjectName("depList")
+                deps_label.setTextFormat(Qt.TextFormat.RichText)
+                deps_label.setWordWrap(True)
+                deps_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+                layout.addWidget(deps_label)
+            
+            # Quick install buttons (enhancement dialog only)
+            if not self.required:
+                install_layout = QHBoxLayout()
+                for dep_name, _, install_cmd in self._resolved:
+                    if self.can_auto_install(install_cmd):
+                        install_btn = QPushButton(f"Install {dep_name}")
+                        install_btn.clicked.connect(
+                            lambda _, cmd=install_cmd, name=dep_name: self.install_dependency(cmd, name)
+                        )
+                        install_layout.addWidget(install_btn)
+                install_layout.addStretch()
+                layout.addLayout(install_layout)
             
             # Terminal instructions
             instructions_frame = QFrame()
-            instructions_frame.setStyleSheet("background-color: #f5f5f5; border: 1px solid #ddd; border-radius: 4px;")
+            instructions_frame.setObjectName("terminalFrame")
             instructions_layout = QVBoxLayout()
             
             instructions_label = QLabel("🖥️ Terminal Installation Guide:")
-            instructions_label.setStyleSheet("font-weight: bold; margin: 5px;")
+            instructions_label.setObjectName("terminalTitle")
             instructions_layout.addWidget(instructions_label)
             
             terminal_text = QTextEdit()
             terminal_text.setMaximumHeight(100)
             terminal_text.setPlainText(self.get_terminal_instructions())
             terminal_text.setReadOnly(True)
-            terminal_text.setStyleSheet("background-color: #2b2b2b; color: #ffffff; font-family: monospace;")
+            terminal_text.setObjectName("terminal")
             instructions_layout.addWidget(terminal_text)
             
             instructions_frame.setLayout(instructions_layout)
@@ -213,114 +550,189 @@ if HAS_QT:
                 exit_btn.clicked.connect(self.reject)
                 button_layout.addWidget(exit_btn)
             else:
+                if len(self.missing_deps) > 1 and self.get_install_batches():
+                    install_all_btn = QPushButton("Install All")
+                    install_all_btn.clicked.connect(self.install_all_dependencies)
+                    button_layout.addWidget(install_all_btn)
+                
                 continue_btn = QPushButton("Continue Without Enhancements")
                 continue_btn.clicked.connect(self.accept)
                 button_layout.addWidget(continue_btn)
             
-            layout.addWidget(QWidget())  # Spacer
+            layout.addStretch()  # Spacer; yields to the stretched list view when present
             layout.addLayout(button_layout)
             
             self.setLayout(layout)
+            self.setUpdatesEnabled(True)
         
-        def create_dependency_frame(self, dep_name: str, dep_info: Dict) -> QFrame:
-            """Create a frame for a single dependency"""
-            frame = QFrame()
-            frame.setStyleSheet("border: 1px solid #ddd; border-radius: 4px; margin: 5px; padding: 10px;")
-            
-            layout = QVBoxLayout()
-            
-            # Dependency name and description
-            name_label = QLabel(f"📦 {dep_name}")
-            name_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-            layout.addWidget(name_label)
-            
-            desc_label = QLabel(dep_info['description'])
-            desc_label.setStyleSheet("color: #666; margin-left: 20px;")
-            layout.addWidget(desc_label)
-            
-            # Installation command
-            commands = dep_info.get("commands", {})
-            install_cmd = commands.get(self.distro, commands.get("unknown", f"# Please install {dep_name}"))
-            
-            cmd_layout = QHBoxLayout()
-            cmd_label = QLabel(f"Install: {install_cmd}")
-            cmd_label.setStyleSheet("font-family: monospace; background-color: #f0f0f0; padding: 5px; border-radius: 2px;")
-            cmd_layout.addWidget(cmd_label)
-            
-            # Quick install button (if not enhancement-only dialog)
-            if not self.required and self.can_auto_install(install_cmd):
-                install_btn = QPushButton("Install")
-                install_btn.setMaximumWidth(80)
-                install_btn.clicked.connect(lambda: self.install_dependency(install_cmd, dep_name))
-                cmd_layout.addWidget(install_btn)
-            
-            layout.addLayout(cmd_layout)
+        def dependency_html(self, dep_name: str, dep_info: Dict, install_cmd: str) -> str:
+            """Render a single dependency as rich text"""
+            parts = [
+                f"<p style='font-weight: bold; font-size: 14px;'>📦 {html.escape(dep_name)}</p>",
+                f"<p style='color: #666; margin-left: 20px;'>{html.escape(dep_info['description'])}</p>",
+                f"<p style='font-family: monospace; background-color: #f0f0f0;'>Install: {html.escape(install_cmd)}</p>",
+            ]
             
             # Benefits (for enhancements)
             if not self.required and "benefits" in dep_info:
-                benefits_label = QLabel("Benefits:")
-                benefits_label.setStyleSheet("font-weight: bold; margin-top: 5px; margin-left: 20px;")
-                layout.addWidget(benefits_label)
-                
-                for benefit in dep_info["benefits"][:3]:  # Show first 3 benefits
-                    benefit_label = QLabel(f"• {benefit}")
-                    benefit_label.setStyleSheet("margin-left: 40px; color: #555;")
-                    layout.addWidget(benefit_label)
+                parts.append("<p style='font-weight: bold; margin-left: 20px;'>Benefits:</p>")
+                parts.append("<ul style='margin-left: 20px; color: #555;'>")
+                parts.extend(  # Show first 3 benefits
+                    f"<li>{html.escape(benefit)}</li>" for benefit in dep_info["benefits"][:3]
+                )
+                parts.append("</ul>")
             
-            frame.setLayout(layout)
-            return frame
+            return "".join(parts)
+        
+        def dependency_rows(self) -> List[Tuple[str, str, str, Tuple[str, ...]]]:
+            """Flatten dependencies into (name, description, install_cmd, benefits) rows for DepsModel"""
+            return [
+                (
+                    dep_name,
+                    dep_info['description'],
+                    install_cmd,
+                    () if self.required else tuple(dep_info.get("benefits", ())[:3]),
+                )
+                for dep_name, dep_info, install_cmd in self._resolved
+            ]
         
         def can_auto_install(self, command: str) -> bool:
             """Check if we can auto-install this dependency"""
-            # Only allow auto-install for safe package managers
-            safe_commands = ['sudo apt install', 'sudo pacman -S', 'flatpak install']
-            return any(command.startswith(safe) for safe in safe_commands)
+            return command.startswith(_SAFE_PREFIXES)
+        
+        def get_auto_install_prefix(self, command: str) -> Optional[str]:
+            """Return the package manager prefix of an auto-installable command"""
+            for safe in _SAFE_PREFIXES:
+                if command.startswith(safe):
+                    return safe
+            return None
+        
+        def get_install_batches(self) -> List[Tuple[str, str]]:
+            """Group auto-installable dependencies into one (command, label) per package manager"""
+            groups = {}
+            for dep_name, _, install_cmd in self._resolved:
+                prefix = self.get_auto_install_prefix(install_cmd)
+                if prefix:
+                    names, packages = groups.setdefault(prefix, ([], []))
+                    names.append(dep_name)
+                    packages.append(install_cmd[len(prefix):].strip())
+            
+            return [
+                (f"{prefix} {' '.join(packages)}", ", ".join(names))
+                for prefix, (names, packages) in groups.items()
+            ]
         
         def install_dependency(self, command: str, package_name: str):
             """Install dependency in background thread"""
-            if self.install_thread and self.install_thread.isRunning():
+            self.start_installation([(command, package_name)])
+        
+        def install_all_dependencies(self):
+            """Install every auto-installable dependency with one command per package manager"""
+            self.start_installation(self.get_install_batches())
+        
+        def start_installation(self, jobs: List[Tuple[str, str]]):
+            """Run each (command, label) job on the qasync loop, or on the shared thread pool"""
+            if len(self.install_results) < self.install_count:
                 return
             
             # Show progress dialog
-            self.progress = QProgressDialog(f"Installing {package_name}...", "Cancel", 0, 0, self)
+            label = ", ".join(package_name for _, package_name in jobs)
+            self.progress = QProgressDialog(f"Installing {label}...", "Cancel", 0, 0, self)
             self.progress.setWindowModality(Qt.WindowModality.WindowModal)
             self.progress.show()
             
-            # Start installation thread
-            self.install_thread = DependencyInstallThread(command, package_name)
-            self.install_thread.progress_update.connect(self.progress.setLabelText)
-            self.install_thread.installation_complete.connect(self.installation_finished)
-            self.install_thread.start()
+            self.install_count = len(jobs)
+            self.install_results = []
+            self.install_workers = []
+            self.install_tasks = []
+            
+            # Independent jobs (e.g. apt and flatpak) run concurrently either way
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            
+            if loop is not None:
+                for command, package_name in jobs:
+                    self.install_tasks.append(loop.create_task(self.install_async(command, package_name)))
+                self.progress.canceled.connect(self.cancel_installation)
+                return
+            
+            # Fallback without a running qasync loop: pooled threads.
+            # Workers are kept referenced until they report back.
+            for command, package_name in jobs:
+                worker = InstallWorker(command, package_name)
+                worker.setAutoDelete(False)
+                worker.signals.progress_update.connect(self.progress.setLabelText)
+                worker.signals.installation_complete.connect(self.installation_finished)
+                self.install_workers.append(worker)
+                self._pool.start(worker)
+        
+        async def install_async(self, command: str, package_name: str):
+            """Install a dependency as a subprocess awaited on the running event loop"""
+            self.progress.setLabelText(f"Installing {package_name}...")
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *shlex.split(command),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT
+                )
+                try:
+                    async for raw_line in proc.stdout:
+                        line = raw_line.decode(errors="replace").rstrip()
+                        if line:
+                            self.progress.setLabelText(line)
+                    returncode = await proc.wait()
+                except asyncio.CancelledError:
+                    # SIGTERM, unlike SIGKILL, is forwarded by sudo to the package manager.
+                    # Keep draining so it can't block on a full pipe while it winds down.
+                    proc.terminate()
+                    async for _ in proc.stdout:
+                        pass
+                    await proc.wait()
+                    raise
+                
+                if returncode == 0:
+                    result = (True, f"{package_name} installed successfully!")
+                else:
+                    result = (False, f"Installation failed: {command} exited with status {returncode}")
+            except asyncio.CancelledError:
+                result = (False, f"Installation of {package_name} cancelled")
+            except Exception as e:
+                result = (False, f"Error: {e}")
+            
+            # Report from the Qt event loop rather than from inside the task,
+            # since the result message box runs a nested event loop
+            QTimer.singleShot(0, lambda: self.installation_finished(*result))
+        
+        def cancel_installation(self):
+            """Cancel running async installs (pooled thread installs cannot be interrupted)"""
+            for task in self.install_tasks:
+                task.cancel()
         
         def installation_finished(self, success: bool, message: str):
             """Handle installation completion"""
+            self.install_results.append((success, message))
+            if len(self.install_results) < self.install_count:
+                return
+            
             self.progress.close()
             
-            if success:
-                QMessageBox.information(self, "Installation Complete", message)
+            summary = "\n".join(result_message for _, result_message in self.install_results)
+            if all(result_success for result_success, _ in self.install_results):
+                QMessageBox.information(self, "Installation Complete", summary)
             else:
-                QMessageBox.warning(self, "Installation Failed", message)
+                QMessageBox.warning(self, "Installation Failed", summary)
         
         def get_terminal_instructions(self) -> str:
             """Get terminal installation instructions"""
-            instructions = []
-            instructions.append("1. Open terminal: Ctrl+Alt+T (or search 'Terminal')")
-            instructions.append("2. Copy and run these commands:")
-            instructions.append("")
-            
-            for dep_name, dep_info in self.missing_deps:
-                commands = dep_info.get("commands", {})
-                install_cmd = commands.get(self.distro, commands.get("unknown", f"# Install {dep_name}"))
-                instructions.append(f"   {install_cmd}")
-            
-            instructions.append("")
-            instructions.append("3. Run Easy EXE again after installation!")
-            
-            return "\n".join(instructions)
+            return _build_terminal_instructions(tuple(install_cmd for _, _, install_cmd in self._resolved))
 
     class UnknownProgramDialog(QDialog):
         """Dialog for identifying unknown programs"""
         
+        _CHOICES = ('game', 'app')
+        
         def __init__(self, exe_path: str, pe_info: Dict):
             super().__init__()
             self.exe_path = exe_path
@@ -330,54 +742,41 @@ if HAS_QT:
             self.setup_ui()
         
         def setup_ui(self):
-            detected_name = self.pe_info.get('product_name', Path(self.exe_path).stem)
-            self.setWindowTitle(f"Unknown Program: {detected_name}")
+            self.setUpdatesEnabled(False)
             
             layout = QVBoxLayout()
             layout.setSpacing(10)
             
             # Header
             header = QLabel("❓ Unknown Program Detected")
-            header.setStyleSheet("font-size: 16px; font-weight: bold; margin: 8px;")
+            header.setObjectName("programHeader")
             layout.addWidget(header)
             
-            # Program info (more compact)
-            info_frame = QFrame()
-            info_frame.setStyleSheet("background-color: #f8f8f8; border: 1px solid #ddd; border-radius: 4px; padding: 8px;")
-            info_layout = QVBoxLayout()
-            info_layout.setSpacing(4)
-            
-            name_label = QLabel(f"{detected_name}")
-            name_label.setStyleSheet("font-weight: bold; font-size: 13px;")
-            info_layout.addWidget(name_label)
-            
-            if self.pe_info.get('company_name'):
-                company_label = QLabel(f"by {self.pe_info['company_name']}")
-                company_label.setStyleSheet("color: #666; font-size: 11px;")
-                info_layout.addWidget(company_label)
-            
-            info_frame.setLayout(info_layout)
-            layout.addWidget(info_frame)
+            # Program info (more compact), rendered as a single rich-text label
+            self.info_label = QLabel()
+            self.info_label.setObjectName("programInfo")
+            self.info_label.setTextFormat(Qt.TextFormat.RichText)
+            layout.addWidget(self.info_label)
             
             # Explanation (more concise)
             explanation = QLabel("Help classify this program for optimal setup:")
-            explanation.setStyleSheet("margin: 5px; color: #555; font-size: 12px;")
+            explanation.setObjectName("explanation")
             layout.addWidget(explanation)
             
             # Radio buttons for choice (more compact)
             self.button_group = QButtonGroup()
             
-            game_radio = QRadioButton("🎮 Game - Use Lutris for optimized setup")
-            game_radio.setChecked(True)  # Default selection
-            game_radio.toggled.connect(lambda checked: self.set_choice("game" if checked else None))
-            self.button_group.addButton(game_radio)
-            layout.addWidget(game_radio)
+            self.game_radio = QRadioButton("🎮 Game - Use Lutris for optimized setup")
+            self.button_group.addButton(self.game_radio, 0)
+            layout.addWidget(self.game_radio)
             
             app_radio = QRadioButton("📦 Application - Set up with Wine")
-            app_radio.toggled.connect(lambda checked: self.set_choice("app" if checked else None))
-            self.button_group.addButton(app_radio)
+            self.button_group.addButton(app_radio, 1)
             layout.addWidget(app_radio)
             
+            # Button ids index into _CHOICES
+            self.button_group.idClicked.connect(self._on_choice)
+            
             # Buttons
             button_layout = QHBoxLayout()
             
@@ -394,34 +793,36 @@ if HAS_QT:
             
             layout.addLayout(button_layout)
             self.setLayout(layout)
+            self.setUpdatesEnabled(True)
             
-            # Apply compact sizing
-            self.apply_compact_sizing()
+            # Fill in program-specific text and apply compact sizing
+            self.reset(self.exe_path, self.pe_info)
         
-        def apply_compact_sizing(self):
-            """Apply smart compact sizing"""
-            self.adjustSize()
-            
-            screen = QApplication.primaryScreen().availableGeometry()
-            max_width = int(screen.width() * 0.30)  # Slightly smaller for simple dialog
-            max_height = int(screen.height() * 0.25)
+        def reset(self, exe_path: str, pe_info: Dict):
+            """Show a different program so the dialog can be reused"""
+            self.exe_path = exe_path
+            self.pe_info = pe_info
+            detected_name = pe_info.get('product_name', Path(exe_path).stem)
+            self.setWindowTitle(f"Unknown Program: {detected_name}")
             
-            min_width = 350
-            min_height = 180
+            info_html = f"<span style='font-weight: bold; font-size: 13px;'>{html.escape(detected_name)}</span>"
+            if pe_info.get('company_name'):
+                info_html += f"<br><span style='color: #666; font-size: 11px;'>by {html.escape(pe_info['company_name'])}</span>"
+            self.info_label.setText(info_html)
             
-            optimal_size = self.sizeHint()
-            final_width = min(max(optimal_size.width(), min_width), max_width)
-            final_height = min(max(optimal_size.height(), min_height), max_height)
+            # Back to the default selection
+            self.game_radio.setChecked(True)
+            self.choice = "game"
             
-            self.resize(final_width, final_height)
-            self.move(
-                (screen.width() - final_width) // 2,
-                (screen.height() - final_height) // 2
-            )
+            self.apply_compact_sizing()
         
-        def set_choice(self, choice: str):
-            if choice:
-                self.choice = choice
+        def apply_compact_sizing(self):
+            """Apply smart compact sizing"""
+            # Slightly smaller than the other dialogs since there is less to show
+            _apply_compact_size(self, len(self.info_label.text()) // 16, 0.30, 0.25, 350, 180)
+        
+        def _on_choice(self, button_id: int):
+            self.choice = self._CHOICES[button_id]
         
         def get_choice(self) -> str:
             return self.choice
@@ -438,90 +839,35 @@ if HAS_QT:
             self.setup_ui()
         
         def setup_ui(self):
+            self.setUpdatesEnabled(False)
             self.setWindowTitle("Linux Alternative Available")
             
             layout = QVBoxLayout()
             
             # Header
             header = QLabel("💡 Linux Alternative Available!")
-            header.setStyleSheet("font-size: 16px; font-weight: bold; color: #1976d2; margin: 8px;")
+            header.setObjectName("alternativeHeader")
             layout.addWidget(header)
             
-            alternatives = self.program_config.get("alternatives", {})
-            recommended = alternatives.get("recommended", {})
-            
-            if recommended:
-                # Compact program comparison
-                comparison_frame = QFrame()
-                comparison_frame.setStyleSheet("border: 1px solid #ddd; border-radius: 4px; padding: 12px;")
-                comparison_layout = QVBoxLayout()
-                comparison_layout.setSpacing(8)
-                
-                # Windows vs Linux comparison (horizontal)
-                vs_layout = QHBoxLayout()
-                
-                # Windows side
-                win_layout = QVBoxLayout()
-                win_label = QLabel("Windows:")
-                win_label.setStyleSheet("font-weight: bold; color: #666;")
-                win_layout.addWidget(win_label)
-                
-                win_name = QLabel(self.program_config['name'])
-                win_name.setStyleSheet("font-size: 13px;")
-                win_layout.addWidget(win_name)
-                
-                vs_layout.addLayout(win_layout)
-                
-                # Arrow
-                arrow_label = QLabel("→")
-                arrow_label.setStyleSheet("font-size: 18px; color: #1976d2; margin: 0 10px;")
-                vs_layout.addWidget(arrow_label)
-                
-                # Linux side
-                linux_layout = QVBoxLayout()
-                linux_label = QLabel("Linux:")
-                linux_label.setStyleSheet("font-weight: bold; color: #4caf50;")
-                linux_layout.addWidget(linux_label)
-                
-                alt_name = QLabel(recommended['name'])
-                alt_name.setStyleSheet("font-size: 13px; color: #4caf50; font-weight: bold;")
-                linux_layout.addWidget(alt_name)
-                
-                vs_layout.addLayout(linux_layout)
-                vs_layout.addStretch()  # Push content left
-                
-                comparison_layout.addLayout(vs_layout)
-                
-                # Quick summary
-                if recommended.get("quick_summary"):
-                    summary_label = QLabel(recommended["quick_summary"])
-                    summary_label.setStyleSheet("color: #555; font-size: 12px; margin-left: 10px;")
-                    summary_label.setWordWrap(True)
-                    comparison_layout.addWidget(summary_label)
-                
-                # Critical caveat (only if present)
-                if recommended.get("critical_caveat"):
-                    caveat_label = QLabel(f"⚠️ {recommended['critical_caveat']}")
-                    caveat_label.setStyleSheet("color: #f57c00; font-size: 11px; margin-left: 10px; font-style: italic;")
-                    caveat_label.setWordWrap(True)
-                    comparison_layout.addWidget(caveat_label)
-                
-                comparison_frame.setLayout(comparison_layout)
-                layout.addWidget(comparison_frame)
+            # Program comparison: Windows vs Linux table plus notes, as one rich-text label
+            self.comparison_label = QLabel()
+            self.comparison_label.setObjectName("comparison")
+            self.comparison_label.setTextFormat(Qt.TextFormat.RichText)
+            self.comparison_label.setWordWrap(True)
+            layout.addWidget(self.comparison_label)
             
             # Action buttons (more compact)
             button_layout = QVBoxLayout()
             button_layout.setSpacing(6)
             
-            if recommended:
-                install_btn = QPushButton(f"🚀 Install {recommended['name']}")
-                install_btn.setStyleSheet("QPushButton { background-color: #4caf50; color: white; font-weight: bold; padding: 8px; }")
-                install_btn.clicked.connect(lambda: self.set_choice("install"))
-                button_layout.addWidget(install_btn)
+            self.install_btn = QPushButton()
+            self.install_btn.setObjectName("installButton")
+            self.install_btn.clicked.connect(lambda: self.set_choice("install"))
+            button_layout.addWidget(self.install_btn)
             
-            continue_btn = QPushButton(f"📦 Continue with {self.program_config['name']}")
-            continue_btn.clicked.connect(lambda: self.set_choice("continue"))
-            button_layout.addWidget(continue_btn)
+            self.continue_btn = QPushButton()
+            self.continue_btn.clicked.connect(lambda: self.set_choice("continue"))
+            button_layout.addWidget(self.continue_btn)
             
             # More info and settings in horizontal layout
             bottom_layout = QHBoxLayout()
@@ -545,38 +891,65 @@ if HAS_QT:
             layout.addLayout(button_layout)
             
             self.setLayout(layout)
+            self.setUpdatesEnabled(True)
             
-            # Apply compact sizing (3x3 grid approach)
-            self.apply_compact_sizing()
+            self.reset(self.program_config)
         
-        def apply_compact_sizing(self):
-            """Apply smart compact sizing - max 33% of screen"""
-            # Calculate optimal size first
-            self.adjustSize()
-            
-            # Get screen dimensions
-            screen = QApplication.primaryScreen().availableGeometry()
-            
-            # 3x3 grid approach - max 33% of screen in either dimension
-            max_width = int(screen.width() * 0.33)
-            max_height = int(screen.height() * 0.33)
+        def reset(self, program_config: Dict):
+            """Show a different program's alternative so the dialog can be reused"""
+            self.program_config = program_config
+            self.choice = "continue"
+            self.disable_checkbox.setChecked(False)
             
-            # Reasonable minimums for readability
-            min_width = 420
-            min_height = 200
+            alternatives = program_config.get("alternatives", {})
+            recommended = alternatives.get("recommended", {})
             
-            # Smart sizing
-            optimal_size = self.sizeHint()
-            final_width = min(max(optimal_size.width(), min_width), max_width)
-            final_height = min(max(optimal_size.height(), min_height), max_height)
+            if recommended:
+                comparison_html = (
+                    "<table cellspacing='0'><tr>"
+                    "<td><span style='font-weight: bold; color: #666;'>Windows:</span><br>"
+                    f"<span style='font-size: 13px;'>{html.escape(program_config['name'])}</span></td>"
+                    "<td style='vertical-align: middle; padding: 0 10px; font-size: 18px; color: #1976d2;'>→</td>"
+                    "<td><span style='font-weight: bold; color: #4caf50;'>Linux:</span><br>"
+                    f"<span style='font-size: 13px; color: #4caf50; font-weight: bold;'>{html.escape(recommended['name'])}</span></td>"
+                    "</tr></table>"
+                )
+                
+                # Quick summary
+                if recommended.get("quick_summary"):
+                    comparison_html += (
+                        "<p style='color: #555; font-size: 12px; margin-left: 10px;'>"
+                        f"{html.escape(recommended['quick_summary'])}</p>"
+                    )
+                
+                # Critical caveat (only if present)
+                if recommended.get("critical_caveat"):
+                    comparison_html += (
+                        "<p style='color: #f57c00; font-size: 11px; margin-left: 10px; font-style: italic;'>"
+                        f"⚠️ {html.escape(recommended['critical_caveat'])}</p>"
+                    )
+                
+                self.comparison_label.setText(comparison_html)
+                self.install_btn.setText(f"🚀 Install {recommended['name']}")
             
-            self.resize(final_width, final_height)
+            # Without a recommendation only the continue/info/cancel options apply
+            self.comparison_label.setVisible(bool(recommended))
+            self.install_btn.setVisible(bool(recommended))
+            self.continue_btn.setText(f"📦 Continue with {program_config['name']}")
             
-            # Center on screen
-            self.move(
-                (screen.width() - final_width) // 2,
-                (screen.height() - final_height) // 2
+            # Apply compact sizing (3x3 grid approach)
+            self.apply_compact_sizing()
+        
+        def apply_compact_sizing(self):
+            """Apply smart compact sizing - max 33% of screen"""
+            # 3x3 grid approach - max 33% of screen in either dimension,
+            # with reasonable minimums for readability
+            fingerprint = (
+                self.comparison_label.isHidden(),
+                len(self.comparison_label.text()) // 16,
+                len(self.continue_btn.text()) // 16,
             )
+            _apply_compact_size(self, fingerprint, 0.33, 0.33, 420, 200)
         
         def set_choice(self, choice: str):
             self.choice = choice
@@ -601,7 +974,7 @@ if HAS_QT:
             self.setup_ui()
         
         def setup_ui(self):
-            self.setWindowTitle(f"Warning - {self.program_name}")
+            self.setUpdatesEnabled(False)
             
             layout = QVBoxLayout()
             layout.setSpacing(10)
@@ -609,43 +982,47 @@ if HAS_QT:
             # Warning icon and header (more compact)
             header_layout = QHBoxLayout()
             warning_label = QLabel("⚠️")
-            warning_label.setStyleSheet("font-size: 24px;")
+            warning_label.setObjectName("warningIcon")
             header_layout.addWidget(warning_label)
             
-            title_label = QLabel(f"Notice - {self.program_name}")
-            title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #f57c00;")
-            header_layout.addWidget(title_label)
+            self.title_label = QLabel()
+            self.title_label.setObjectName("warningTitle")
+            header_layout.addWidget(self.title_label)
             header_layout.addStretch()
             
             layout.addLayout(header_layout)
             
             # Warning message
-            message_template = self.easy_exe.messages.get(self.warning_type, {}).get("message", "")
-            message = message_template.format(game_name=self.program_name)
+            msg_block = self.easy_exe.messages.get(self.warning_type) or {}
+            self.message_template = msg_block.get("message", "")
             
-            message_label = QLabel(message)
-            message_label.setWordWrap(True)
-            message_label.setStyleSheet("margin: 5px; font-size: 12px;")
-            layout.addWidget(message_label)
+            self.message_label = QLabel()
+            self.message_label.setWordWrap(True)
+            self.message_label.setObjectName("warningMessage")
+            layout.addWidget(self.message_label)
             
             # Instructions (more compact)
-            instructions = self.easy_exe.messages.get(self.warning_type, {}).get("instructions", [])
+            instructions = msg_block.get("instructions", ())
             if instructions:
                 instructions_frame = QFrame()
-                instructions_frame.setStyleSheet("background-color: #f8f8f8; border: 1px solid #ddd; border-radius: 4px; padding: 8px;")
+                instructions_frame.setObjectName("instructionsFrame")
                 instructions_layout = QVBoxLayout()
                 instructions_layout.setSpacing(3)
                 
                 instructions_title = QLabel("💡 How to handle this:")
-                instructions_title.setStyleSheet("font-weight: bold; font-size: 12px;")
+                instructions_title.setObjectName("instructionsTitle")
                 instructions_layout.addWidget(instructions_title)
                 
-                # Show only first 2 instructions to keep compact
-                for instruction in instructions[:2]:
-                    instruction_label = QLabel(f"• {instruction}")
-                    instruction_label.setWordWrap(True)
-                    instruction_label.setStyleSheet("margin-left: 5px; font-size: 11px;")
-                    instructions_layout.addWidget(instruction_label)
+                # Show only first 2 instructions to keep compact, as one rich-text list
+                instruction_label = QLabel(
+                    "<ul style='margin: 0; -qt-list-indent: 1;'>"
+                    + "".join(f"<li>{html.escape(instruction)}</li>" for instruction in instructions[:2])
+                    + "</ul>"
+                )
+                instruction_label.setTextFormat(Qt.TextFormat.RichText)
+                instruction_label.setWordWrap(True)
+                instruction_label.setObjectName("instruction")
+                instructions_layout.addWidget(instruction_label)
                 
                 instructions_frame.setLayout(instructions_layout)
                 layout.addWidget(instructions_frame)
@@ -654,7 +1031,7 @@ if HAS_QT:
             bottom_layout = QHBoxLayout()
             
             self.disable_checkbox = QCheckBox("Don't show again")
-            self.disable_checkbox.setStyleSheet("font-size: 11px;")
+            self.disable_checkbox.setObjectName("disableCheckbox")
             bottom_layout.addWidget(self.disable_checkbox)
             
             bottom_layout.addStretch()
@@ -670,51 +1047,30 @@ if HAS_QT:
             
             layout.addLayout(bottom_layout)
             self.setLayout(layout)
+            self.setUpdatesEnabled(True)
+            
+            self.reset(self.program_name)
+        
+        def reset(self, program_name: str):
+            """Update the program-specific text so the dialog can be reused"""
+            self.program_name = program_name
+            self.setWindowTitle(f"Warning - {program_name}")
+            self.title_label.setText(f"Notice - {program_name}")
+            self.message_label.setText(self.message_template.format(game_name=program_name))
+            self.disable_checkbox.setChecked(False)
             
-            # Apply compact sizing
             self.apply_compact_sizing()
         
         def apply_compact_sizing(self):
             """Apply smart compact sizing"""
-            self.adjustSize()
-            
-            screen = QApplication.primaryScreen().availableGeometry()
-            max_width = int(screen.width() * 0.32)
-            max_height = int(screen.height() * 0.28)
-            
-            min_width = 380
-            min_height = 160
-            
-            optimal_size = self.sizeHint()
-            final_width = min(max(optimal_size.width(), min_width), max_width)
-            final_height = min(max(optimal_size.height(), min_height), max_height)
-            
-            self.resize(final_width, final_height)
-            self.move(
-                (screen.width() - final_width) // 2,
-                (screen.height() - final_height) // 2
-            )
+            fingerprint = (self.warning_type, len(self.message_label.text()) // 16)
+            _apply_compact_size(self, fingerprint, 0.32, 0.28, 380, 160)
         
         def should_disable_warnings(self) -> bool:
             return self.disable_checkbox.isChecked()
 
-else:
-    # Dummy classes when PyQt6 is not available
-    class DependencyDialog:
-        def __init__(self, *args, **kwargs):
-            pass
-    
-    class UnknownProgramDialog:
-        def __init__(self, *args, **kwargs):
-            pass
-    
-    class AlternativeDialog:
-        def __init__(self, *args, **kwargs):
-            pass
-    
-    class WarningDialog:
-        def __init__(self, *args, **kwargs):
-            pass
+# Bound by _define_dialog_classes() once PyQt6 has been imported
+InstallWorker = DependencyDialog = UnknownProgramDialog = AlternativeDialog = WarningDialog = None
 
 def create_gui_wrapper(easy_exe_instance):
     """Create GUI wrapper instance"""
@@ -722,8 +1078,8 @@ def create_gui_wrapper(easy_exe_instance):
 
 # Test function for development
 if __name__ == "__main__":
-    if HAS_QT:
-        app = QApplication(sys.argv)
+    if _ensure_qt():
+        app = EasyEXEGUI._get_application()
         
         # Mock data for testing
         mock_deps = [
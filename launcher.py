@@ -7,29 +7,70 @@ This script handles launching Easy EXE with proper error handling for missing de
 import sys
 import subprocess
 import os
+import re
+import json
+import hashlib
+import functools
+import importlib.util
+import runpy
 from pathlib import Path
 
+# Locations resolved once at import; resolve() so a symlinked launcher still finds its files
+SCRIPT_DIR = Path(__file__).resolve().parent
+REQUIREMENTS_FILE = SCRIPT_DIR / "requirements.txt"
+MAIN_SCRIPT = SCRIPT_DIR / "easy_exe.py"
+CACHE_DIR = Path.home() / ".cache" / "easy-exe"
+HASH_FILE = CACHE_DIR / ".requirements_hash"
+# Marker older releases left after their first-run setup, before the hash existed
+LEGACY_MARKER = CACHE_DIR / ".first_run_complete"
+
+# Fixed prefix of every pip install command line
+PIP_INSTALL = (sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input")
+
+# Import names of requirements whose module differs from the package name
+IMPORT_NAMES = {"beautifulsoup4": "bs4"}
+
+# Status messages shared by several code paths; only the variable part is formatted in
+MSG_INSTALLED = "   ✅ {} installed"
+MSG_INSTALL_FAILED = "   ❌ Failed to install {}"
+MSG_CLI_MODE = "💡 {} - running in CLI mode"
+MSG_NO_SCRIPT = "❌ Main script not found: {}"
+
+# Oldest interpreter Easy EXE supports
+MIN_PYTHON = (3, 7)
+
 def check_python_version():
     """Ensure we have Python 3.7+"""
-    if sys.version_info < (3, 7):
-        print("❌ Easy EXE requires Python 3.7 or later")
+    if sys.version_info < MIN_PYTHON:
+        print(f"❌ Easy EXE requires Python {'.'.join(map(str, MIN_PYTHON))} or later")
         print(f"   Current version: {sys.version}")
         sys.exit(1)
 
 def install_requirements():
     """Install required Python packages"""
-    requirements_file = Path(__file__).parent / "requirements.txt"
+    if REQUIREMENTS_FILE.exists():
+        requirements = read_requirements(REQUIREMENTS_FILE)
+        missing = [requirement for requirement in requirements if not is_installed(requirement_name(requirement))]
+        if missing:
+            # Hand pip the whole list so raised minimums on installed packages are applied
+            # too; it skips whatever is already satisfied within the same process
+            to_install = requirements
+        else:
+            # Everything imports, but requirements.txt changed since the last setup,
+            # so have pip check the version specifiers without installing anything
+            to_install = unsatisfied_requirements(requirements)
+            if not to_install:
+                print("✅ Dependencies already installed")
+                return True
+            missing = to_install
 
-    if requirements_file.exists():
-        print("📦 Installing Python dependencies from requirements.txt...")
+        print(f"📦 Installing Python dependencies: {', '.join(missing)}...")
         try:
-            result = subprocess.run([
-                sys.executable, "-m", "pip", "install", "-r", str(requirements_file)
-            ], check=True, capture_output=True, text=True)
+            pip_install(*to_install)
             print("✅ Dependencies installed successfully")
             return True
         except subprocess.CalledProcessError as e:
-            print(f"❌ Requirements file installation failed:")
+            print("❌ Dependency installation failed:")
             print(f"   Exit code: {e.returncode}")
             if e.stderr:
                 print(f"   Error: {e.stderr}")
@@ -39,92 +80,194 @@ def install_requirements():
         print("⚠️  Requirements file not found")
         print("🔄 Installing packages individually...")
         return install_minimal_requirements()
-    """Install just the core requirements one by one"""
-    core_packages = ["requests", "beautifulsoup4", "lxml"]
-    optional_packages = ["PyQt6"]
 
-    print("📦 Installing core dependencies...")
-    success_count = 0
+def requirements_hash(requirements_file):
+    """SHA-256 of requirements.txt (of nothing if it is missing or unreadable)"""
+    try:
+        data = requirements_file.read_bytes()
+    except OSError:
+        data = b""
+    return hashlib.sha256(data).hexdigest()
 
-    for package in core_packages:
-        try:
-            print(f"   Installing {package}...")
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", package
-            ], check=True, capture_output=True)
-            success_count += 1
-            print(f"   ✅ {package} installed")
-        except subprocess.CalledProcessError:
-            print(f"   ❌ Failed to install {package}")
+def read_stored_hash():
+    """Hash recorded by the last successful setup, or None before the first one"""
+    try:
+        return HASH_FILE.read_text().strip()
+    except OSError:
+        # Missing, unreadable or not a file: treat it as never set up
+        return None
+
+def read_requirements(requirements_file):
+    """Requirement lines from requirements.txt, without comments or pip options"""
+    requirements = []
+    for line in requirements_file.read_text().splitlines():
+        requirement = line.split("#", 1)[0].strip()
+        if requirement and not requirement.startswith("-"):
+            requirements.append(requirement)
+    return requirements
+
+def requirement_name(requirement):
+    """Package name of a requirement line, without extras, markers or version specifiers"""
+    return re.split(r"[\s<>=!~;\[]", requirement, maxsplit=1)[0]
+
+def normalize_name(name):
+    """Canonical form of a package name, so PyQt6 and pyqt6 compare equal"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def unsatisfied_requirements(requirements):
+    """Requirements pip would install, from a dry run that touches nothing on disk"""
+    try:
+        result = subprocess.run(
+            [*PIP_INSTALL, "--dry-run", "--quiet", "--report", "-", *requirements],
+            check=True, capture_output=True, text=True
+        )
+        report = json.loads(result.stdout)
+        to_install = {normalize_name(item["metadata"]["name"]) for item in report.get("install", [])}
+    except (subprocess.CalledProcessError, ValueError, KeyError, TypeError, AttributeError):
+        # Unresolvable, a pip too old for --dry-run/--report, or a report shape we
+        # don't recognise: let the real install decide
+        return list(requirements)
+
+    if not to_install:
+        return []
+    # Something only a transitive dependency needs still goes through the full requirement set
+    return [
+        requirement for requirement in requirements if normalize_name(requirement_name(requirement)) in to_install
+    ] or list(requirements)
+
+def is_installed(package):
+    """Check whether a package's module can be found, without importing it or asking pip"""
+    return importlib.util.find_spec(IMPORT_NAMES.get(package, package)) is not None
 
-    print(f"\n📦 Installing GUI dependencies...")
-    gui_success = False
+def pip_install(*args):
+    """Run a quiet, non-interactive pip install; raises CalledProcessError on failure"""
+    # pip's progress output is never shown, so discard it; keep stderr for error reports
+    return subprocess.run(
+        [*PIP_INSTALL, *args],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
 
-    for package in optional_packages:
+def install_package_group(packages):
+    """Install packages in one pip call, retrying one by one to find failures; returns (installed, report)"""
+    # Collect output instead of printing so concurrent groups don't interleave
+    report = []
+    try:
+        pip_install(*packages)
+        report.extend(MSG_INSTALLED.format(package) for package in packages)
+        return list(packages), report
+    except subprocess.CalledProcessError:
+        if len(packages) == 1:
+            report.append(MSG_INSTALL_FAILED.format(packages[0]))
+            return [], report
+        report.append("   ⚠️  Batch install failed, retried packages individually")
+
+    installed = []
+    for package in packages:
         try:
-            print(f"   Installing {package}...")
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", package
-            ], check=True, capture_output=True)
-            gui_success = True
-            print(f"   ✅ {package} installed - GUI mode available!")
-            break
+            pip_install(package)
+            installed.append(package)
+            report.append(MSG_INSTALLED.format(package))
         except subprocess.CalledProcessError:
-            print(f"   ❌ Failed to install {package}")
+            report.append(MSG_INSTALL_FAILED.format(package))
+    return installed, report
+
+def install_minimal_requirements():
+    """Install just the core requirements, one pip call per group"""
+    # Only this fallback runs installs concurrently; keep the import off the normal launch path
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    groups = {
+        "core": ["requests", "beautifulsoup4", "lxml"],
+        "GUI": ["PyQt6"],
+    }
 
-    if not gui_success:
+    # Packages that are already present count as installed and are never handed to pip
+    installed = {label: [package for package in packages if is_installed(package)] for label, packages in groups.items()}
+    pending = {
+        label: [package for package in packages if package not in installed[label]]
+        for label, packages in groups.items()
+    }
+    pending = {label: packages for label, packages in pending.items() if packages}
+
+    if pending:
+        # pip spends most of its time on network I/O, so install the groups side by
+        # side and print each report as it completes. pip takes no lock on the
+        # environment, so this is only safe because the groups share no distribution,
+        # transitive ones included: core pulls in urllib3/idna/certifi/charset-normalizer/
+        # soupsieve, GUI only PyQt6-sip/PyQt6-Qt6. Keep it that way when editing the groups.
+        print(f"📦 Installing {' and '.join(pending)} dependencies...")
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {executor.submit(install_package_group, packages): label for label, packages in pending.items()}
+            for future in as_completed(futures):
+                label = futures[future]
+                newly_installed, report = future.result()
+                installed[label].extend(newly_installed)
+                # One write per finished group, flushed so it shows while the other runs
+                print("\n".join([f"\n📦 {label} dependencies:", *report]), flush=True)
+
+    if installed["GUI"]:
+        print("   GUI mode available!")
+    else:
         print("   💡 GUI will not be available, but CLI mode will work")
 
-    return success_count >= 2  # Need at least requests and beautifulsoup4
+    return len(installed["core"]) >= 2  # Need at least requests and beautifulsoup4
 
+@functools.lru_cache(maxsize=1)
 def check_gui_availability():
     """Check if GUI components are available"""
-    try:
-        import PyQt6
-        # Check if we have a display
-        if os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'):
-            return True
-        else:
-            print("💡 No display detected - running in CLI mode")
-            return False
-    except ImportError:
-        print("💡 PyQt6 not available - running in CLI mode")
+    # Check for a display first; without one there is no point locating PyQt6
+    if not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        print(MSG_CLI_MODE.format("No display detected"))
+        return False
+
+    # Only locate PyQt6; importing it would load its C extensions just to test presence
+    if importlib.util.find_spec("PyQt6") is None:
+        print(MSG_CLI_MODE.format("PyQt6 not available"))
         return False
 
+    return True
+
 def main():
     """Main launcher function"""
     check_python_version()
 
-    # Determine script location
-    script_dir = Path(__file__).parent
-    main_script = script_dir / "easy_exe.py"
-
-    if not main_script.exists():
-        print(f"❌ Main script not found: {main_script}")
+    if not MAIN_SCRIPT.exists():
+        print(MSG_NO_SCRIPT.format(MAIN_SCRIPT))
         sys.exit(1)
 
-    # Check if this is the first run
-    cache_dir = Path.home() / ".cache" / "easy-exe"
-    first_run_marker = cache_dir / ".first_run_complete"
+    # Set up on first run, and again whenever requirements.txt changes
+    current_hash = requirements_hash(REQUIREMENTS_FILE)
+    stored_hash = read_stored_hash()
+    ran_setup = stored_hash != current_hash
 
-    if not first_run_marker.exists():
-        print("🎉 Welcome to Easy EXE!")
-        print("   Setting up for first use...")
+    if ran_setup:
+        if stored_hash is None and not LEGACY_MARKER.exists():
+            print("🎉 Welcome to Easy EXE!")
+            print("   Setting up for first use...")
+        else:
+            print("📦 Requirements changed - updating dependencies...")
 
         # Try to install requirements
         if install_requirements():
             print("   GUI mode will be available")
 
-        # Create marker file
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        first_run_marker.touch()
+            # Record what was installed; write then rename so a partial hash is never seen
+            try:
+                if not CACHE_DIR.is_dir():
+                    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_file = HASH_FILE.with_name(HASH_FILE.name + ".tmp")
+                tmp_file.write_text(current_hash)
+                os.replace(tmp_file, HASH_FILE)
+            except OSError as e:
+                # Setup simply runs again next launch
+                print(f"⚠️  Could not record setup state: {e}")
         print("   Setup complete!\n")
 
     # Check GUI availability
     gui_available = check_gui_availability()
 
     # Prepare command line arguments
-    cmd = [sys.executable, str(main_script)]
+    cmd = [sys.executable, str(MAIN_SCRIPT)]
 
     # Add CLI flag if GUI is not available
     if not gui_available:
@@ -134,6 +277,15 @@ def main():
     cmd.extend(sys.argv[1:])
 
     # Launch Easy EXE
+    if not ran_setup:
+        # Run it in this interpreter rather than paying for a second start-up;
+        # SystemExit from Easy EXE carries its exit code straight through
+        sys.argv = cmd[1:]
+        runpy.run_path(str(MAIN_SCRIPT), run_name="__main__")
+        return
+
+    # Packages installed just now may sit in a site directory this interpreter
+    # never put on sys.path, so hand off to a fresh one
     try:
         # For AppImage usage, we want to replace the current process
         # This ensures clean process handling and proper exit codes
@@ -0,0 +1,86 @@
+"""Tests for the launcher's requirement parsing and pip dry-run probe"""
+
+import json
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import launcher
+
+
+REQUIREMENTS = ["requests>=2.31.0", "beautifulsoup4>=4.12.0", "PyQt6>=6.4.0"]
+
+
+def fake_run(stdout="", returncode=0):
+    """Stand-in for subprocess.run that returns (or raises for) a canned pip result"""
+    def run(cmd, check=False, **kwargs):
+        if check and returncode:
+            raise subprocess.CalledProcessError(returncode, cmd, output=stdout)
+        return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr="")
+    return run
+
+
+def report(*names):
+    """A pip --report document installing the given distributions"""
+    return json.dumps({
+        "version": "1",
+        "install": [{"metadata": {"name": name, "version": "1.0"}} for name in names],
+    })
+
+
+class TestRequirementParsing(unittest.TestCase):
+    def test_read_requirements_skips_comments_blanks_and_options(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            requirements_file = Path(tmp) / "requirements.txt"
+            requirements_file.write_text(
+                "# Core\n"
+                "requests>=2.31.0\n"
+                "\n"
+                "-r other.txt\n"
+                "lxml>=4.9.0  # parser\n"
+            )
+            self.assertEqual(
+                launcher.read_requirements(requirements_file),
+                ["requests>=2.31.0", "lxml>=4.9.0"],
+            )
+
+    def test_requirement_name_strips_specifiers_extras_and_markers(self):
+        self.assertEqual(launcher.requirement_name("requests>=2.31.0"), "requests")
+        self.assertEqual(launcher.requirement_name("requests[socks]==2.31"), "requests")
+        self.assertEqual(launcher.requirement_name("lxml; python_version > '3.7'"), "lxml")
+        self.assertEqual(launcher.requirement_name("PyQt6"), "PyQt6")
+
+
+class TestUnsatisfiedRequirements(unittest.TestCase):
+    def probe(self, stdout="", returncode=0):
+        with mock.patch.object(launcher.subprocess, "run", fake_run(stdout, returncode)):
+            return launcher.unsatisfied_requirements(REQUIREMENTS)
+
+    def test_empty_install_list_means_satisfied(self):
+        self.assertEqual(self.probe(report()), [])
+
+    def test_only_listed_requirements_are_returned(self):
+        self.assertEqual(self.probe(report("requests")), ["requests>=2.31.0"])
+
+    def test_names_are_normalized(self):
+        self.assertEqual(self.probe(report("pyqt6")), ["PyQt6>=6.4.0"])
+        self.assertEqual(self.probe(report("BeautifulSoup4")), ["beautifulsoup4>=4.12.0"])
+
+    def test_transitive_only_install_uses_full_list(self):
+        self.assertEqual(self.probe(report("urllib3")), REQUIREMENTS)
+
+    def test_non_zero_exit_uses_full_list(self):
+        self.assertEqual(self.probe(report(), returncode=1), REQUIREMENTS)
+
+    def test_non_json_output_uses_full_list(self):
+        self.assertEqual(self.probe("no such option: --report"), REQUIREMENTS)
+
+    def test_report_item_without_name_uses_full_list(self):
+        self.assertEqual(self.probe(json.dumps({"install": [{"metadata": {}}]})), REQUIREMENTS)
+        self.assertEqual(self.probe(json.dumps({"install": [{}]})), REQUIREMENTS)
+
+
+if __name__ == "__main__":
+    unittest.main()